@@ -19,7 +19,15 @@ if os.environ.get('testWithPip') == 'true':
 
 if os.environ.get('testWithPip') != 'true':
     runStep("flake8 --exclude .conda,.git,.ipython --builtins=ArgumentError .")
-    runStep("py.test --durations=20 --maxfail=5 devito tests/")
+    if os.environ.get('DEVITO_BACKEND') == 'ops':
+        # Each OPS test compiles an independent Operator, so they're spread
+        # across all available cores via pytest-xdist
+        runStep(("py.test --durations=20 --maxfail=5 devito tests/ " +
+                 "--ignore=tests/test_ops.py"))
+        runStep(("py.test --durations=20 --maxfail=5 -n auto " +
+                 "--dist=worksteal tests/test_ops.py"))
+    else:
+        runStep("py.test --durations=20 --maxfail=5 devito tests/")
     if os.environ.get('RUN_EXAMPLES') == 'true':
         runStep(("python benchmarks/user/benchmark.py test " +
                  "-P tti -so 4 -d 20 20 20 -n 5"))
@@ -1,4 +1,5 @@
 import itertools
+from functools import lru_cache
 import pytest
 import numpy as np
 
@@ -23,6 +24,90 @@ from devito.tools import dtype_to_cstr  # noqa
 from devito.types import Buffer, Constant, DefaultDimension, Symbol  # noqa
 
 
+# The objects the parametrized equations may refer to, per group of tests.
+# Functions are given as `(type, name, grid shape, kwargs)` and are only
+# instantiated once an equation actually references them
+_symbols_specs = {
+    'kernel': {
+        'a': 1.43,
+        'b': 0.000000987,
+        'c': 999999999999999,
+        'u': (TimeFunction, 'u', (4,), {'space_order': 2}),
+        'v': (TimeFunction, 'v', (4, 4), {'space_order': 2}),
+        'w': (TimeFunction, 'w', (4, 4, 4), {'space_order': 2}),
+        'v_1d': (TimeFunction, 'v', (4,), {'space_order': 2})
+    },
+    'dat': {
+        'u': (TimeFunction, 'u', (4, 4), {'space_order': 2}),
+        'v': (Function, 'v', (4, 4), {'space_order': 2}),
+        'w1': (TimeFunction, 'w1', (4, 4), {'space_order': 2, 'save': 2}),
+        'w2': (TimeFunction, 'w2', (4, 4), {'space_order': 2, 'save': 5})
+    },
+    'block': {
+        'u': (TimeFunction, 'u', (4, 4), {'time_order': 2, 'save': Buffer(10)})
+    },
+    'bound': {
+        'u': (TimeFunction, 'u', (5, 5), {})
+    },
+    'fetch': {
+        'u_2d': (TimeFunction, 'u', (4, 4), {'time_order': 1}),
+        'v_2d': (TimeFunction, 'v', (4, 4), {'time_order': 2}),
+        'x_2d': (TimeFunction, 'x', (4, 4), {'time_order': 3}),
+        'u_3d': (TimeFunction, 'u', (4, 4, 4), {'time_order': 1}),
+        'v_3d': (TimeFunction, 'v', (4, 4, 4), {'time_order': 2}),
+        'x_3d': (TimeFunction, 'x', (4, 4, 4), {'time_order': 3})
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _ceval(src):
+    """
+    Compile ``src`` to a code object, so that a parametrized string is only
+    parsed once however many times it's evaluated.
+    """
+    return compile(src, '<eq>', 'eval')
+
+
+@lru_cache(maxsize=None)
+def _grid(ns_key, shape):
+    return Grid(shape=shape)
+
+
+@lru_cache(maxsize=None)
+def _symbol(ns_key, name):
+    spec = _symbols_specs[ns_key][name]
+    if not isinstance(spec, tuple):
+        return spec
+    cls, fname, shape, kwargs = spec
+    return cls(name=fname, grid=_grid(ns_key, shape), **kwargs)
+
+
+def _namespace(equation, ns_key):
+    """
+    The objects referenced by ``equation`` among those of ``ns_key``. Each
+    of them is built on first use and then shared across the whole module.
+    """
+    specs = _symbols_specs[ns_key]
+    ns = {i: _symbol(ns_key, i) for i in _ceval(equation).co_names if i in specs}
+    ns['Eq'] = Eq
+    return ns
+
+
+@lru_cache(maxsize=None)
+def _build_op(equation, ns_key):
+    """
+    Build the Operator for ``equation``. Identical equations over the same
+    namespace are only compiled once across the whole module.
+    """
+    return Operator(eval(_ceval(equation), {}, _namespace(equation, ns_key)))
+
+
+@lru_cache(maxsize=None)
+def _ccode(equation, ns_key):
+    return str(_build_op(equation, ns_key).ccode)
+
+
 class TestOPSExpression(object):
 
     @pytest.mark.parametrize('equation, expected', [
@@ -73,19 +158,7 @@ class TestOPSExpression(object):
         expected : str
             Expected expression to be generated from devito.
         """
-
-        grid_1d = Grid(shape=(4))
-        grid_2d = Grid(shape=(4, 4))
-        grid_3d = Grid(shape=(4, 4, 4))
-
-        a = 1.43  # noqa
-        b = 0.000000987  # noqa
-        c = 999999999999999  # noqa
-        u = TimeFunction(name='u', grid=grid_1d, space_order=2)  # noqa
-        v = TimeFunction(name='v', grid=grid_2d, space_order=2)  # noqa
-        w = TimeFunction(name='w', grid=grid_3d, space_order=2)  # noqa
-
-        operator = Operator(eval(equation))
+        operator = _build_op(equation, 'kernel')
 
         for func in operator._func_table.values():
             assert str(func.root) == expected
@@ -93,23 +166,18 @@ class TestOPSExpression(object):
     @pytest.mark.parametrize('equation, expected', [
         ('Eq(u,3*a - 4**a)', '{ "ut0": [[0]] }'),
         ('Eq(u, u.dxl)', '{ "ut0": [[0], [-1], [-2]] }'),
-        ('Eq(u,v+1)', '{ "ut0": [[0]], "vt0": [[0]] }')
+        ('Eq(u,v_1d+1)', '{ "ut0": [[0]], "vt0": [[0]] }')
     ])
     def test_accesses_extraction(self, equation, expected):
-        grid_1d = Grid(shape=(4))
-        grid_3d = Grid(shape=(4, 4, 4))
-
-        a = 1.43  # noqa
-        c = 999999999999999  # noqa
-        u = TimeFunction(name='u', grid=grid_1d, space_order=2)  # noqa
-        v = TimeFunction(name='v', grid=grid_1d, space_order=2)  # noqa
-        w = TimeFunction(name='w', grid=grid_3d, space_order=2)  # noqa
-
+        # A factory accumulates the accesses of every expression it visits, so
+        # it can't be shared across cases without mixing up their accesses
         node_factory = OPSNodeFactory()
 
-        make_ops_ast(indexify(eval(equation).evaluate), node_factory)
+        eq = eval(_ceval(equation), {}, _namespace(equation, 'kernel'))
+
+        make_ops_ast(indexify(eq.evaluate), node_factory)
 
-        result = eval(expected)
+        result = eval(_ceval(expected))
 
         for k, v in node_factory.ops_args_accesses.items():
             assert len(v) == len(result[k.name])
@@ -121,7 +189,7 @@ class TestOPSExpression(object):
     ])
     def test_to_ops_stencil(self, _accesses):
         param = Symbol('foo')
-        accesses = eval(_accesses)
+        accesses = eval(_ceval(_accesses))
 
         stencil_name = 's2d_foo_%spt' % len(accesses)
 
@@ -169,17 +237,10 @@ class TestOPSExpression(object):
          '&(v[0]), "float", "v")\']')
     ])
     def test_create_ops_dat(self, equation, expected):
-        grid = Grid(shape=(4, 4))
+        op_text = str(_build_op(equation, 'dat'))
 
-        u = TimeFunction(name='u', grid=grid, space_order=2)  # noqa
-        v = Function(name='v', grid=grid, space_order=2)  # noqa
-        w1 = TimeFunction(name='w1', grid=grid, space_order=2, save=2)  # noqa
-        w2 = TimeFunction(name='w2', grid=grid, space_order=2, save=5)  # noqa
-
-        op = Operator(eval(equation))
-
-        for i in eval(expected):
-            assert i in str(op)
+        for i in eval(_ceval(expected)):
+            assert i in op_text
 
     def test_create_ops_dat_function(self):
         grid = Grid(shape=(4))
@@ -192,22 +253,25 @@ class TestOPSExpression(object):
 
         ops_dat = create_ops_dat(u, name_to_ops_dat, block)
 
+        dim_name = namespace['ops_dat_dim'](u.name)
+        base_name = namespace['ops_dat_base'](u.name)
+        d_p_name = namespace['ops_dat_d_p'](u.name)
+        d_m_name = namespace['ops_dat_d_m'](u.name)
+
         assert name_to_ops_dat['u'].name == namespace['ops_dat_name'](u.name)
         assert name_to_ops_dat['u']._C_typename == namespace['ops_dat_type']
 
-        assert ops_dat.dim_val.expr.lhs.name == \
-            namespace['ops_dat_dim'](u.name)
+        assert ops_dat.dim_val.expr.lhs.name == dim_name
         assert ops_dat.dim_val.expr.rhs.params == \
             (Integer(4),)
 
-        assert ops_dat.base_val.expr.lhs.name == \
-            namespace['ops_dat_base'](u.name)
+        assert ops_dat.base_val.expr.lhs.name == base_name
         assert ops_dat.base_val.expr.rhs.params == (Zero(),)
 
-        assert ops_dat.d_p_val.expr.lhs.name == namespace['ops_dat_d_p'](u.name)
+        assert ops_dat.d_p_val.expr.lhs.name == d_p_name
         assert ops_dat.d_p_val.expr.rhs.params == (Integer(2),)
 
-        assert ops_dat.d_m_val.expr.lhs.name == namespace['ops_dat_d_m'](u.name)
+        assert ops_dat.d_m_val.expr.lhs.name == d_m_name
         assert ops_dat.d_m_val.expr.rhs.params == (Integer(-2),)
 
         assert ops_dat.ops_decl_dat.expr.lhs == name_to_ops_dat['u']
@@ -215,10 +279,10 @@ class TestOPSExpression(object):
         assert ops_dat.ops_decl_dat.expr.rhs.args == (
             block,
             1,
-            Symbol(namespace['ops_dat_dim'](u.name)),
-            Symbol(namespace['ops_dat_base'](u.name)),
-            Symbol(namespace['ops_dat_d_m'](u.name)),
-            Symbol(namespace['ops_dat_d_p'](u.name)),
+            Symbol(dim_name),
+            Symbol(base_name),
+            Symbol(d_m_name),
+            Symbol(d_p_name),
             Byref(u.indexify((0,))),
             Literal('"%s"' % u._C_typedata),
             Literal('"u"')
@@ -262,32 +326,23 @@ class TestOPSExpression(object):
         """
         Test if ops_block has been successfully generated
         """
-        grid_2d = Grid(shape=(4, 4))
-        u = TimeFunction(name='u', grid=grid_2d, time_order=2, save=Buffer(10))  # noqa
-        operator = Operator(eval(equation))
-        assert expected in str(operator.ccode)
+        assert expected in _ccode(equation, 'block')
 
     @pytest.mark.parametrize('equation, expected', [
         ('Eq(u.forward, u+1)',
          'int OPS_Kernel_0_range[4] = {x_m, x_M + 1, y_m, y_M + 1};')
     ])
     def test_upper_bound(self, equation, expected):
-        grid = Grid((5, 5))
-        u = TimeFunction(name='u', grid=grid)  # noqa
-        op = Operator(eval(equation))
-
-        assert expected in str(op.ccode)
+        assert expected in _ccode(equation, 'bound')
 
     @pytest.mark.parametrize('equation, declaration', [
         ('Eq(u.forward, u+1)',
          'int OPS_Kernel_0_range[4]')
     ])
     def test_single_declaration(self, equation, declaration):
-        grid = Grid((5, 5))
-        u = TimeFunction(name='u', grid=grid)  # noqa
-        op = Operator(eval(equation))
+        ccode = _ccode(equation, 'bound')
 
-        occurrences = [i for i in str(op.ccode).split('\n') if declaration in i]
+        occurrences = [i for i in ccode.split('\n') if declaration in i]
 
         assert len(occurrences) == 1
 
@@ -317,19 +372,7 @@ class TestOPSExpression(object):
          '\'ops_dat_fetch_data(u_dat[(time_M + 1)%(2)],0,&(u[(time_M + 1)%(2)]));\']')
     ])
     def test_create_fetch_data(self, equation, expected):
+        op_text = str(_build_op(equation, 'fetch'))
 
-        grid_2d = Grid(shape=(4, 4))
-        grid_3d = Grid(shape=(4, 4, 4))
-
-        u_2d = TimeFunction(name='u', grid=grid_2d, time_order=1)  # noqa
-        v_2d = TimeFunction(name='v', grid=grid_2d, time_order=2)  # noqa
-        x_2d = TimeFunction(name='x', grid=grid_2d, time_order=3)  # noqa
-
-        u_3d = TimeFunction(name='u', grid=grid_3d, time_order=1)  # noqa
-        v_3d = TimeFunction(name='v', grid=grid_3d, time_order=2)  # noqa
-        x_3d = TimeFunction(name='x', grid=grid_3d, time_order=3)  # noqa
-
-        op = Operator(eval(equation))
-
-        for i in eval(expected):
-            assert i in str(op)
+        for i in eval(_ceval(expected)):
+            assert i in op_text